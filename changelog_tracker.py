@@ -1,6 +1,11 @@
 """
 Automated Changelog and Release Notes Manager
 blackroad-changelog-tracker: Track, generate, and manage changelogs with semantic versioning.
+
+Each tracker holds a single lazily-opened SQLite connection guarded by a lock.
+The database is switched to WAL journaling once in ``_init_db``; that setting
+is persisted in the database file, so a new connection only pays for the
+cheap per-connection PRAGMAs (synchronous, temp_store, cache_size, mmap_size).
 """
 
 import argparse
@@ -9,12 +14,20 @@ import logging
 import os
 import re
 import sqlite3
-from dataclasses import dataclass, field, asdict
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Optional
 from uuid import uuid4
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON encoding
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -32,6 +45,7 @@ TYPE_DOCS = "docs"
 TYPE_CHORE = "chore"
 
 CHANGE_TYPES = [TYPE_FEAT, TYPE_FIX, TYPE_BREAKING, TYPE_PERF, TYPE_REFACTOR, TYPE_DOCS, TYPE_CHORE]
+_CHANGE_TYPE_SET = frozenset(CHANGE_TYPES)
 
 TYPE_EMOJI = {
     TYPE_FEAT: "✨",
@@ -53,6 +67,131 @@ TYPE_SECTION = {
     TYPE_CHORE: "Chores",
 }
 
+# (type, emoji, section title) in changelog output order.
+_TYPE_META: tuple = tuple((t, TYPE_EMOJI[t], TYPE_SECTION[t]) for t in CHANGE_TYPES)
+
+_PR_LINK = " ([#{pr}](https://github.com/pulls/{pr}))"
+
+_SEMVER_RE = re.compile(r"(\d+)\.(\d+)\.(\d+)(.*)")
+_VERSION_SORT_RE = re.compile(r"[vV]?(\d+)\.(\d+)\.(\d+)(.*)")
+
+# Bumped whenever _init_db needs to rewrite an existing database.
+_SCHEMA_VERSION = 2
+
+_CHANGE_ENTRIES_COLUMNS = """
+    id TEXT PRIMARY KEY,
+    project TEXT NOT NULL,
+    version TEXT NOT NULL,
+    type TEXT NOT NULL,
+    summary TEXT NOT NULL,
+    details TEXT DEFAULT '',
+    pr_number INTEGER,
+    author TEXT DEFAULT '',
+    date TEXT NOT NULL,
+    version_sort TEXT
+"""
+
+_INSERT_ENTRY_SQL = """INSERT INTO change_entries
+   (id, project, version, type, summary, details, pr_number, author, date, version_sort)
+   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# An entry is finalized once a releases row exists for its project/version;
+# entry queries derive the is_finalized column through this join.
+_ENTRIES_WITH_FINALIZED = """SELECT e.*, r.id IS NOT NULL AS is_finalized
+   FROM change_entries e
+   LEFT JOIN releases r ON r.project=e.project AND r.version=e.version"""
+
+# Hot-path statements live at module scope so every call hands the
+# connection's statement cache the exact same SQL text.
+_SQL_SELECT_ENTRIES_VER = _ENTRIES_WITH_FINALIZED + """
+   WHERE e.project=? AND e.version=?
+   ORDER BY e.date, e.rowid"""
+
+_SQL_SELECT_HIGHLIGHTS = f"""SELECT summary FROM change_entries
+   WHERE project=? AND version=? AND type IN ('{TYPE_FEAT}', '{TYPE_BREAKING}')
+   ORDER BY date, rowid LIMIT 5"""
+
+_SQL_UPSERT_RELEASE = """INSERT OR REPLACE INTO releases
+   (id, project, version, release_date, highlights, version_sort)
+   VALUES (?, ?, ?, ?, ?, ?)"""
+
+_SQL_SELECT_RELEASES_WITH_ENTRIES = """SELECT r.version, r.release_date, r.highlights,
+          e.type, e.summary, e.details, e.pr_number, e.author, e.date
+   FROM (SELECT version, release_date, highlights, version_sort FROM releases
+         WHERE project=? ORDER BY version_sort DESC, release_date DESC LIMIT ?) r
+   LEFT JOIN change_entries e
+     ON e.project=? AND e.version=r.version
+   ORDER BY r.version_sort DESC, r.release_date DESC, r.version, e.date, e.rowid"""
+
+_SQL_PENDING_TYPES = """SELECT MAX(e.type=?) AS has_breaking, MAX(e.type=?) AS has_feat
+   FROM change_entries e
+   WHERE e.project=? AND NOT EXISTS (
+       SELECT 1 FROM releases r WHERE r.project=e.project AND r.version=e.version)"""
+
+_SQL_SEARCH_WITH_PROJ = _ENTRIES_WITH_FINALIZED + """
+   JOIN change_entries_fts f ON f.rowid=e.rowid
+   WHERE change_entries_fts MATCH ? AND e.project=?
+   ORDER BY e.date DESC, e.rowid DESC"""
+
+_SQL_SEARCH_NO_PROJ = _ENTRIES_WITH_FINALIZED + """
+   JOIN change_entries_fts f ON f.rowid=e.rowid
+   WHERE change_entries_fts MATCH ?
+   ORDER BY e.date DESC, e.rowid DESC"""
+
+_SQL_SEARCH_LIKE_WITH_PROJ = _ENTRIES_WITH_FINALIZED + """
+   WHERE e.project=? AND (e.summary LIKE ? ESCAPE '\\' OR e.details LIKE ? ESCAPE '\\')
+   ORDER BY e.date DESC, e.rowid DESC"""
+
+_SQL_SEARCH_LIKE_NO_PROJ = _ENTRIES_WITH_FINALIZED + """
+   WHERE e.summary LIKE ? ESCAPE '\\' OR e.details LIKE ? ESCAPE '\\'
+   ORDER BY e.date DESC, e.rowid DESC"""
+
+_MIN_QUERY_LEN = 3
+
+_SQL_LIST_PROJECTS = "SELECT DISTINCT project FROM change_entries ORDER BY project"
+
+_SQL_LIST_VERSIONS = """SELECT e.version, MAX(r.id IS NOT NULL) AS is_finalized
+   FROM change_entries e
+   LEFT JOIN releases r ON r.project=e.project AND r.version=e.version
+   WHERE e.project=?
+   GROUP BY e.version
+   ORDER BY MAX(e.version_sort) DESC, MAX(e.date) DESC"""
+
+
+def version_sort_key(version: str) -> str:
+    """Return a string that sorts semantic versions in numeric order.
+
+    ``1.10.0`` becomes ``00000001.00000010.00000000~``; a pre-release suffix
+    replaces the trailing ``~`` so ``1.0.0-rc1`` sorts just below ``1.0.0``.
+    A leading ``v`` is ignored. Non-semver versions (e.g. ``dev``) map to
+    ``""`` and sort last.
+    """
+    match = _VERSION_SORT_RE.fullmatch(version)
+    if not match:
+        return ""
+    major, minor, patch, suffix = match.groups()
+    return f"{int(major):08d}.{int(minor):08d}.{int(patch):08d}{suffix or '~'}"
+
+
+def _dumps_bytes(obj) -> bytes:
+    """Serialize ``obj`` as indented UTF-8 JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, separators=(",", ": "), ensure_ascii=False).encode()
+
+
+def _dumps(obj) -> str:
+    return _dumps_bytes(obj).decode()
+
+
+def _load_highlights(raw: Optional[str]) -> list:
+    """Decode the JSON-encoded ``releases.highlights`` column."""
+    if not raw or raw == "[]":
+        return []
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 @dataclass
 class ChangeEntry:
@@ -69,7 +208,18 @@ class ChangeEntry:
     is_finalized: bool = False
 
     def to_dict(self) -> dict:
-        return asdict(self)
+        return {
+            "id": self.id,
+            "project": self.project,
+            "version": self.version,
+            "type": self.type,
+            "summary": self.summary,
+            "details": self.details,
+            "pr_number": self.pr_number,
+            "author": self.author,
+            "date": self.date,
+            "is_finalized": self.is_finalized,
+        }
 
     @classmethod
     def from_row(cls, row) -> "ChangeEntry":
@@ -119,33 +269,47 @@ class ChangelogTracker:
         tracker.finalize_release("myapp", "1.1.0")
         md = tracker.generate_md("myapp")
         print(md)
+        tracker.close()
     """
 
     def __init__(self, db_path: Optional[Path] = None):
         self.db_path = db_path or DB_PATH
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
         self._init_db()
 
-    def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self.db_path))
+    def __enter__(self) -> "ChangelogTracker":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying database connection, if open."""
+        conn = self.__dict__.pop("_conn", None)
+        if conn is not None:
+            conn.close()
+
+    @cached_property
+    def _conn(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False, cached_statements=256, isolation_level=None,
+        )
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
         return conn
 
     def _init_db(self) -> None:
-        with self._get_conn() as conn:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS change_entries (
-                    id TEXT PRIMARY KEY,
-                    project TEXT NOT NULL,
-                    version TEXT NOT NULL,
-                    type TEXT NOT NULL,
-                    summary TEXT NOT NULL,
-                    details TEXT DEFAULT '',
-                    pr_number INTEGER,
-                    author TEXT DEFAULT '',
-                    date TEXT NOT NULL,
-                    is_finalized INTEGER DEFAULT 0
-                );
+        with self._lock, self._conn as conn:
+            existing = {r["name"] for r in conn.execute("SELECT name FROM sqlite_master")}
+            user_version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if "change_entries" in existing and user_version < _SCHEMA_VERSION:
+                self._migrate(conn)
+            conn.executescript(f"""
+                CREATE TABLE IF NOT EXISTS change_entries ({_CHANGE_ENTRIES_COLUMNS});
 
                 CREATE TABLE IF NOT EXISTS releases (
                     id TEXT PRIMARY KEY,
@@ -153,15 +317,85 @@ class ChangelogTracker:
                     version TEXT NOT NULL,
                     release_date TEXT NOT NULL,
                     highlights TEXT DEFAULT '[]',
+                    version_sort TEXT,
                     UNIQUE(project, version)
                 );
 
-                CREATE INDEX IF NOT EXISTS idx_entries_project ON change_entries(project);
-                CREATE INDEX IF NOT EXISTS idx_entries_version ON change_entries(project, version);
+                -- Prefixes of idx_entries_version_type; dropped to save a write per insert.
+                DROP INDEX IF EXISTS idx_entries_project;
+                DROP INDEX IF EXISTS idx_entries_version;
+                CREATE INDEX IF NOT EXISTS idx_entries_version_type
+                    ON change_entries(project, version, type);
+                CREATE INDEX IF NOT EXISTS idx_entries_semver
+                    ON change_entries(project, version_sort DESC);
                 CREATE INDEX IF NOT EXISTS idx_releases_project ON releases(project);
+                -- Releases are read in version_sort order; this one is unused.
+                DROP INDEX IF EXISTS idx_releases_project_date;
+                CREATE INDEX IF NOT EXISTS idx_releases_semver
+                    ON releases(project, version_sort DESC);
+
+                CREATE VIRTUAL TABLE IF NOT EXISTS change_entries_fts USING fts5(
+                    summary, details, content='change_entries', content_rowid='rowid'
+                );
+
+                CREATE TRIGGER IF NOT EXISTS change_entries_ai AFTER INSERT ON change_entries BEGIN
+                    INSERT INTO change_entries_fts(rowid, summary, details)
+                    VALUES (new.rowid, new.summary, new.details);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS change_entries_ad AFTER DELETE ON change_entries BEGIN
+                    INSERT INTO change_entries_fts(change_entries_fts, rowid, summary, details)
+                    VALUES ('delete', old.rowid, old.summary, old.details);
+                END;
+
+                CREATE TRIGGER IF NOT EXISTS change_entries_au AFTER UPDATE OF summary, details ON change_entries BEGIN
+                    INSERT INTO change_entries_fts(change_entries_fts, rowid, summary, details)
+                    VALUES ('delete', old.rowid, old.summary, old.details);
+                    INSERT INTO change_entries_fts(rowid, summary, details)
+                    VALUES (new.rowid, new.summary, new.details);
+                END;
+
+                PRAGMA user_version = {_SCHEMA_VERSION};
             """)
+            if "change_entries_fts" not in existing:
+                # Index rows written before the FTS table existed.
+                conn.execute("INSERT INTO change_entries_fts(change_entries_fts) VALUES('rebuild')")
+            if not {"idx_entries_version_type", "idx_entries_semver"} <= existing:
+                # Gather planner statistics once so the new indexes get picked.
+                conn.execute("ANALYZE")
+            conn.execute("PRAGMA journal_mode=WAL")
         logger.debug("DB initialized at %s", self.db_path)
 
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Bring a database created by an older release up to ``_SCHEMA_VERSION``.
+
+        Adds and (re)computes ``version_sort``, then rebuilds ``change_entries``
+        without the old ``is_finalized`` column (finalized state now comes from
+        ``releases``). Rowids are kept so the FTS index stays valid.
+        """
+        conn.create_function("version_sort_key", 1, version_sort_key, deterministic=True)
+        for table in ("change_entries", "releases"):
+            columns = {r["name"] for r in conn.execute(f"PRAGMA table_info({table})")}
+            if "version_sort" not in columns:
+                conn.execute(f"ALTER TABLE {table} ADD COLUMN version_sort TEXT")
+            # Recomputed on every upgrade in case version_sort_key itself changed.
+            conn.execute(f"UPDATE {table} SET version_sort=version_sort_key(version)")
+
+        columns = {r["name"] for r in conn.execute("PRAGMA table_info(change_entries)")}
+        if "is_finalized" in columns:
+            keep = "id, project, version, type, summary, details, pr_number, author, date, version_sort"
+            conn.executescript(f"""
+                BEGIN;
+                CREATE TABLE change_entries_new ({_CHANGE_ENTRIES_COLUMNS});
+                INSERT INTO change_entries_new (rowid, {keep})
+                    SELECT rowid, {keep} FROM change_entries;
+                DROP TABLE change_entries;
+                ALTER TABLE change_entries_new RENAME TO change_entries;
+                COMMIT;
+            """)
+        logger.info("Migrated database schema to version %d.", _SCHEMA_VERSION)
+
     def add_change(
         self,
         project: str,
@@ -186,29 +420,63 @@ class ChangelogTracker:
         Returns:
             The created ChangeEntry.
         """
-        if change_type not in CHANGE_TYPES:
-            raise ValueError(f"Invalid change type: {change_type}. Must be one of {CHANGE_TYPES}")
+        return self.add_changes([{
+            "project": project,
+            "version": version,
+            "change_type": change_type,
+            "summary": summary,
+            "details": details,
+            "pr_number": pr_number,
+            "author": author,
+        }])[0]
+
+    def add_changes(self, entries: list) -> list:
+        """Add many change entries in a single transaction.
 
-        entry = ChangeEntry(
-            id=str(uuid4()),
-            project=project,
-            version=version,
-            type=change_type,
-            summary=summary,
-            details=details,
-            pr_number=pr_number,
-            author=author,
-        )
-        with self._get_conn() as conn:
-            conn.execute(
-                """INSERT INTO change_entries
-                   (id, project, version, type, summary, details, pr_number, author, date, is_finalized)
-                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, 0)""",
-                (entry.id, entry.project, entry.version, entry.type,
-                 entry.summary, entry.details, entry.pr_number, entry.author, entry.date),
+        Args:
+            entries: List of dicts with the same keys as ``add_change`` arguments
+                (project, version, change_type, summary, and optionally
+                details, pr_number, author). An optional ``date`` key keeps
+                the original timestamp; otherwise the whole batch shares one.
+
+        Returns:
+            List of created ChangeEntry objects, in input order.
+        """
+        now = datetime.utcnow().isoformat()
+        created = []
+        for e in entries:
+            change_type = e["change_type"]
+            if change_type not in _CHANGE_TYPE_SET:
+                raise ValueError(f"Invalid change type: {change_type}. Must be one of {CHANGE_TYPES}")
+            created.append(ChangeEntry(
+                id=uuid4().hex,
+                project=e["project"],
+                version=e["version"],
+                type=change_type,
+                summary=e["summary"],
+                details=e.get("details") or "",
+                pr_number=e.get("pr_number"),
+                author=e.get("author") or "",
+                date=e.get("date") or now,
+            ))
+        if not created:
+            return created
+
+        with self._lock, self._conn as conn:
+            conn.execute("BEGIN")
+            conn.executemany(
+                _INSERT_ENTRY_SQL,
+                [(c.id, c.project, c.version, c.type, c.summary, c.details,
+                  c.pr_number, c.author, c.date, version_sort_key(c.version)) for c in created],
             )
-        logger.info("Added %s change for %s@%s: %s", change_type, project, version, summary[:50])
-        return entry
+            conn.commit()
+
+        if len(created) == 1:
+            c = created[0]
+            logger.info("Added %s change for %s@%s: %s", c.type, c.project, c.version, c.summary[:50])
+        else:
+            logger.info("Added %d changes.", len(created))
+        return created
 
     def finalize_release(self, project: str, version: str) -> Release:
         """Finalize a release, locking all change entries for that version.
@@ -220,35 +488,30 @@ class ChangelogTracker:
         Returns:
             The Release dataclass.
         """
-        with self._get_conn() as conn:
-            rows = conn.execute(
-                "SELECT * FROM change_entries WHERE project=? AND version=?",
-                (project, version),
-            ).fetchall()
-
-        if not rows:
-            raise ValueError(f"No changes found for {project}@{version}")
-
-        changes = [ChangeEntry.from_row(r) for r in rows]
-        highlights = [
-            e.summary for e in changes
-            if e.type in (TYPE_FEAT, TYPE_BREAKING)
-        ][:5]
-
         release_date = datetime.utcnow().isoformat()
-        release_id = str(uuid4())
-
-        with self._get_conn() as conn:
+        release_id = uuid4().hex
+
+        # Read and write in one transaction so the release row always
+        # matches the entries it was computed from. IMMEDIATE takes (and
+        # waits for) the write lock up front; a deferred read-then-write
+        # fails in WAL mode if another writer commits in between.
+        with self._lock, self._conn as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(_SQL_SELECT_ENTRIES_VER, (project, version)).fetchall()
+            if not rows:
+                raise ValueError(f"No changes found for {project}@{version}")
+            highlights = [
+                r["summary"]
+                for r in conn.execute(_SQL_SELECT_HIGHLIGHTS, (project, version))
+            ]
             conn.execute(
-                """INSERT OR REPLACE INTO releases (id, project, version, release_date, highlights)
-                   VALUES (?, ?, ?, ?, ?)""",
-                (release_id, project, version, release_date, json.dumps(highlights)),
-            )
-            conn.execute(
-                "UPDATE change_entries SET is_finalized=1 WHERE project=? AND version=?",
-                (project, version),
+                _SQL_UPSERT_RELEASE,
+                (release_id, project, version, release_date, json.dumps(highlights),
+                 version_sort_key(version)),
             )
 
+        changes = [ChangeEntry.from_row(r) for r in rows]
+
         release = Release(
             project=project,
             version=version,
@@ -259,6 +522,30 @@ class ChangelogTracker:
         logger.info("Finalized release %s@%s with %d changes.", project, version, len(changes))
         return release
 
+    def _releases_with_entries(self, project: str, max_versions: int = -1) -> list:
+        """Fetch the latest releases and their entries in one query.
+
+        Returns a list of ``(release_row, entry_rows)`` tuples ordered by
+        semantic version, then release date, newest first. Entries are in
+        insertion order (date, then rowid). A negative ``max_versions`` means
+        no limit.
+        """
+        with self._lock, self._conn as conn:
+            rows = conn.execute(
+                _SQL_SELECT_RELEASES_WITH_ENTRIES,
+                (project, max_versions, project),
+            ).fetchall()
+
+        grouped: list = []
+        current = None
+        for row in rows:
+            if current is None or row["version"] != current[0]["version"]:
+                current = (row, [])
+                grouped.append(current)
+            if row["type"] is not None:
+                current[1].append(row)
+        return grouped
+
     def generate_md(self, project: str, max_versions: int = 5) -> str:
         """Generate a Markdown changelog for a project.
 
@@ -269,12 +556,7 @@ class ChangelogTracker:
         Returns:
             Markdown string.
         """
-        with self._get_conn() as conn:
-            releases = conn.execute(
-                """SELECT version, release_date, highlights FROM releases
-                   WHERE project=? ORDER BY release_date DESC LIMIT ?""",
-                (project, max_versions),
-            ).fetchall()
+        releases = self._releases_with_entries(project, max_versions)
 
         if not releases:
             return f"# Changelog\n\n_No releases found for {project}._\n"
@@ -282,40 +564,31 @@ class ChangelogTracker:
         lines = [f"# Changelog — {project}\n",
                  "_Generated by blackroad-changelog-tracker_\n"]
 
-        for rel in releases:
+        for rel, entries in releases:
             version = rel["version"]
             date = rel["release_date"][:10]
-            highlights = json.loads(rel["highlights"])
+            highlights = _load_highlights(rel["highlights"])
 
             lines.append(f"\n## [{version}] — {date}\n")
 
             if highlights:
                 lines.append("### Highlights\n")
-                for h in highlights:
-                    lines.append(f"- {h}")
+                lines.extend(f"- {h}" for h in highlights)
                 lines.append("")
 
-            with self._get_conn() as conn:
-                entries = conn.execute(
-                    """SELECT * FROM change_entries WHERE project=? AND version=?
-                       ORDER BY type, date""",
-                    (project, version),
-                ).fetchall()
-
+            # Entries arrive in insertion order; bucket them by type in one pass.
             by_type: dict = {}
             for row in entries:
-                t = row["type"]
-                by_type.setdefault(t, []).append(row)
+                by_type.setdefault(row["type"], []).append(row)
 
-            for change_type in CHANGE_TYPES:
-                type_entries = by_type.get(change_type, [])
+            for change_type, emoji, section in _TYPE_META:
+                type_entries = by_type.get(change_type)
                 if not type_entries:
                     continue
-                emoji = TYPE_EMOJI.get(change_type, "")
-                section = TYPE_SECTION.get(change_type, change_type.title())
                 lines.append(f"### {emoji} {section}\n")
                 for e in type_entries:
-                    pr_str = f" ([#{e['pr_number']}](https://github.com/pulls/{e['pr_number']}))" if e["pr_number"] else ""
+                    pr = e["pr_number"]
+                    pr_str = _PR_LINK.format(pr=pr) if pr else ""
                     author_str = f" by @{e['author']}" if e["author"] else ""
                     lines.append(f"- {e['summary']}{pr_str}{author_str}")
                     if e["details"]:
@@ -333,24 +606,24 @@ class ChangelogTracker:
         Returns:
             JSON string.
         """
-        with self._get_conn() as conn:
-            releases = conn.execute(
-                "SELECT * FROM releases WHERE project=? ORDER BY release_date DESC",
-                (project,),
-            ).fetchall()
+        return _dumps(self._changelog_data(project))
 
-        output = []
-        for rel in releases:
-            with self._get_conn() as conn:
-                entries = conn.execute(
-                    "SELECT * FROM change_entries WHERE project=? AND version=?",
-                    (project, rel["version"]),
-                ).fetchall()
+    def write_json(self, project: str, path) -> None:
+        """Write the JSON changelog for a project straight to ``path`` as bytes.
 
+        Args:
+            project: Project identifier.
+            path: Destination file path.
+        """
+        Path(path).write_bytes(_dumps_bytes(self._changelog_data(project)))
+
+    def _changelog_data(self, project: str) -> dict:
+        output = []
+        for rel, entries in self._releases_with_entries(project):
             output.append({
                 "version": rel["version"],
                 "date": rel["release_date"],
-                "highlights": json.loads(rel["highlights"]),
+                "highlights": _load_highlights(rel["highlights"]),
                 "changes": [
                     {
                         "type": e["type"],
@@ -363,7 +636,7 @@ class ChangelogTracker:
                 ],
             })
 
-        return json.dumps({"project": project, "releases": output}, indent=2)
+        return {"project": project, "releases": output}
 
     def semantic_bump(self, project: str, current_version: str) -> str:
         """Suggest next semantic version based on unreleased changes.
@@ -380,73 +653,69 @@ class ChangelogTracker:
         Returns:
             Suggested next version string.
         """
-        match = re.fullmatch(r"(\d+)\.(\d+)\.(\d+)(.*)", current_version)
+        match = _SEMVER_RE.fullmatch(current_version)
         if not match:
             raise ValueError(f"Invalid semver: {current_version}")
         major, minor, patch = int(match.group(1)), int(match.group(2)), int(match.group(3))
         suffix = match.group(4)
 
-        with self._get_conn() as conn:
-            rows = conn.execute(
-                "SELECT type FROM change_entries WHERE project=? AND is_finalized=0",
-                (project,),
-            ).fetchall()
-
-        if not rows:
-            return f"{major}.{minor}.{patch + 1}{suffix}"
+        with self._lock, self._conn as conn:
+            row = conn.execute(
+                _SQL_PENDING_TYPES,
+                (TYPE_BREAKING, TYPE_FEAT, project),
+            ).fetchone()
 
-        types = {r["type"] for r in rows}
-
-        if TYPE_BREAKING in types:
+        if row["has_breaking"]:
             return f"{major + 1}.0.0"
-        if TYPE_FEAT in types:
+        if row["has_feat"]:
             return f"{major}.{minor + 1}.0"
         return f"{major}.{minor}.{patch + 1}{suffix}"
 
     def search_changes(self, query: str, project: Optional[str] = None) -> list:
         """Full-text search across change summaries and details.
 
+        Word and prefix matches are answered from the FTS index; only when
+        that finds nothing is a (literal, escaped) substring scan attempted.
+
         Args:
-            query: Search term.
+            query: Search term, at least 3 characters.
             project: Limit search to this project if provided.
 
         Returns:
             List of matching ChangeEntry dicts.
         """
-        pattern = f"%{query}%"
-        with self._get_conn() as conn:
+        if len(query.strip()) < _MIN_QUERY_LEN:
+            raise ValueError(f"query too short: must be at least {_MIN_QUERY_LEN} characters")
+
+        # Quote each term and match it as a prefix so user input never hits
+        # FTS5 query syntax and partial words ("feat") still find "feature".
+        match = " ".join('"' + t.replace('"', '""') + '"*' for t in query.split())
+        escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        pattern = f"%{escaped}%"
+        with self._lock, self._conn as conn:
             if project:
-                rows = conn.execute(
-                    """SELECT * FROM change_entries
-                       WHERE project=? AND (summary LIKE ? OR details LIKE ?)
-                       ORDER BY date DESC""",
-                    (project, pattern, pattern),
-                ).fetchall()
+                rows = conn.execute(_SQL_SEARCH_WITH_PROJ, (match, project)).fetchall()
+                if not rows:
+                    rows = conn.execute(
+                        _SQL_SEARCH_LIKE_WITH_PROJ, (project, pattern, pattern),
+                    ).fetchall()
             else:
-                rows = conn.execute(
-                    """SELECT * FROM change_entries
-                       WHERE summary LIKE ? OR details LIKE ?
-                       ORDER BY date DESC""",
-                    (pattern, pattern),
-                ).fetchall()
+                rows = conn.execute(_SQL_SEARCH_NO_PROJ, (match,)).fetchall()
+                if not rows:
+                    rows = conn.execute(_SQL_SEARCH_LIKE_NO_PROJ, (pattern, pattern)).fetchall()
 
         return [ChangeEntry.from_row(r).to_dict() for r in rows]
 
     def list_projects(self) -> list:
         """Return all tracked project names."""
-        with self._get_conn() as conn:
-            rows = conn.execute(
-                "SELECT DISTINCT project FROM change_entries ORDER BY project"
-            ).fetchall()
+        with self._lock, self._conn as conn:
+            rows = conn.execute(_SQL_LIST_PROJECTS).fetchall()
         return [r["project"] for r in rows]
 
     def list_versions(self, project: str) -> list:
         """List all versions for a project."""
-        with self._get_conn() as conn:
-            rows = conn.execute(
-                "SELECT DISTINCT version, is_finalized FROM change_entries WHERE project=? ORDER BY date DESC",
-                (project,),
-            ).fetchall()
+        with self._lock, self._conn as conn:
+            rows = conn.execute(_SQL_LIST_VERSIONS, (project,)).fetchall()
         return [{"version": r["version"], "finalized": bool(r["is_finalized"])} for r in rows]
 
 
@@ -467,6 +736,84 @@ def cmd_add(args, tracker: ChangelogTracker) -> None:
     print(f"✓ Added [{entry.type}] {entry.summary[:60]} to {args.project}@{args.version}")
 
 
+def _parse_import_record(rec, path: str, lineno: int, project: Optional[str] = None) -> dict:
+    """Validate one decoded JSONL record and return it as an ``add_changes`` entry."""
+    where = f"{path}:{lineno}"
+    if not isinstance(rec, dict):
+        raise ValueError(f"{where}: expected a JSON object, got {type(rec).__name__}")
+
+    problems = []
+    required = ("version", "summary") if project else ("project", "version", "summary")
+    for key in required:
+        value = rec.get(key)
+        if value is None or value == "":
+            problems.append(f"missing field {key!r}")
+        elif not isinstance(value, str):
+            problems.append(f"{key!r} must be a string, got {type(value).__name__}")
+    for key in ("details", "author", "date"):
+        value = rec.get(key)
+        if value is not None and not isinstance(value, str):
+            problems.append(f"{key!r} must be a string, got {type(value).__name__}")
+    pr_number = rec.get("pr_number", rec.get("pr"))
+    if pr_number is not None and (isinstance(pr_number, bool) or not isinstance(pr_number, int)):
+        problems.append(f"'pr_number' must be an integer, got {type(pr_number).__name__}")
+    change_type = rec.get("change_type", rec.get("type"))
+    if change_type not in _CHANGE_TYPE_SET:
+        problems.append(f"invalid change type: {change_type}. Must be one of {CHANGE_TYPES}")
+    if problems:
+        raise ValueError(f"{where}: {'; '.join(problems)}")
+
+    return {
+        "project": project or rec["project"],
+        "version": rec["version"],
+        "change_type": change_type,
+        "summary": rec["summary"],
+        "details": rec.get("details") or "",
+        "pr_number": pr_number,
+        "author": rec.get("author") or "",
+        "date": rec.get("date"),
+    }
+
+
+def _read_import_batches(path: str, batch_size: int, project: Optional[str] = None):
+    """Yield lists of ``add_changes`` entry dicts parsed from a JSONL file."""
+    batch = []
+    with open(path, encoding="utf-8") as f:
+        for lineno, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                rec = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ValueError(f"{path}:{lineno}: invalid JSON: {exc}") from None
+            batch.append(_parse_import_record(rec, path, lineno, project=project))
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
+
+
+def _positive_int(value: str) -> int:
+    n = int(value)
+    if n < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {n}")
+    return n
+
+
+def cmd_import(args, tracker: ChangelogTracker) -> None:
+    start = time.perf_counter()
+    # Parse and validate the whole file (read once, so pipes work) before the
+    # first batch is committed, so a bad line never leaves a partial import.
+    batches = list(_read_import_batches(args.file, args.batch_size, project=args.project))
+    total = 0
+    for batch in batches:
+        total += len(tracker.add_changes(batch))
+    elapsed = time.perf_counter() - start
+    rate = total / elapsed if elapsed > 0 else 0.0
+    print(f"✓ Imported {total} change(s) from {args.file} in {elapsed:.2f}s ({rate:,.0f} msg/s)")
+
+
 def cmd_finalize(args, tracker: ChangelogTracker) -> None:
     release = tracker.finalize_release(args.project, args.version)
     print(f"✓ Finalized {args.project}@{args.version} with {len(release.changes)} change(s).")
@@ -487,13 +834,11 @@ def cmd_generate_md(args, tracker: ChangelogTracker) -> None:
 
 
 def cmd_generate_json(args, tracker: ChangelogTracker) -> None:
-    output = tracker.generate_json(args.project)
     if args.output:
-        with open(args.output, "w") as f:
-            f.write(output)
+        tracker.write_json(args.project, args.output)
         print(f"✓ Written to {args.output}")
     else:
-        print(output)
+        print(tracker.generate_json(args.project))
 
 
 def cmd_bump(args, tracker: ChangelogTracker) -> None:
@@ -543,6 +888,15 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--author", help="Author username")
     p.set_defaults(func=cmd_add)
 
+    # import
+    p = sub.add_parser("import", help="Bulk-import change entries from a JSONL file "
+                                      "(validated in full before anything is written)")
+    p.add_argument("file", help="JSONL file, one change object per line "
+                                "(project, version, type, summary, details, pr_number, author)")
+    p.add_argument("--batch-size", type=_positive_int, default=500, help="Entries per transaction")
+    p.add_argument("--project", help="Override the project of every entry")
+    p.set_defaults(func=cmd_import)
+
     # finalize
     p = sub.add_parser("finalize", help="Finalize a release")
     p.add_argument("project", help="Project name")
@@ -570,7 +924,7 @@ def build_parser() -> argparse.ArgumentParser:
 
     # search
     p = sub.add_parser("search", help="Search change entries")
-    p.add_argument("query", help="Search term")
+    p.add_argument("query", help="Search term (at least 3 characters)")
     p.add_argument("--project", help="Limit to project")
     p.set_defaults(func=cmd_search)
 
@@ -588,8 +942,8 @@ def main():
         parser.print_help()
         return
     db_path = Path(args.db) if getattr(args, "db", None) else None
-    tracker = ChangelogTracker(db_path=db_path)
-    args.func(args, tracker)
+    with ChangelogTracker(db_path=db_path) as tracker:
+        args.func(args, tracker)
 
 
 if __name__ == "__main__":
@@ -4,14 +4,16 @@ import pytest
 import sys
 sys.path.insert(0, "/tmp")
 from changelog_tracker import (
-    ChangelogTracker, ChangeEntry, Release,
+    ChangelogTracker, ChangeEntry, Release, build_parser,
     TYPE_FEAT, TYPE_FIX, TYPE_BREAKING, TYPE_CHORE,
 )
 
 
 @pytest.fixture
 def tracker(tmp_path):
-    return ChangelogTracker(db_path=tmp_path / "test.db")
+    t = ChangelogTracker(db_path=tmp_path / "test.db")
+    yield t
+    t.close()
 
 
 @pytest.fixture
@@ -24,7 +26,7 @@ def tracker_with_data(tracker):
 
 def test_init_creates_db(tmp_path):
     db = tmp_path / "new.db"
-    ChangelogTracker(db_path=db)
+    ChangelogTracker(db_path=db).close()
     assert db.exists()
 
 
@@ -132,3 +134,270 @@ def test_md_includes_pr_link(tracker):
     tracker.finalize_release("proj", "1.0.0")
     md = tracker.generate_md("proj")
     assert "#42" in md
+
+
+def test_add_changes_bulk(tracker):
+    entries = tracker.add_changes([
+        {"project": "proj", "version": "1.0.0", "change_type": TYPE_FEAT, "summary": "One"},
+        {"project": "proj", "version": "1.0.0", "change_type": TYPE_FIX, "summary": "Two", "pr_number": 7},
+    ])
+    assert [e.summary for e in entries] == ["One", "Two"]
+    release = tracker.finalize_release("proj", "1.0.0")
+    assert len(release.changes) == 2
+
+
+def test_add_changes_invalid_type_inserts_nothing(tracker):
+    with pytest.raises(ValueError, match="Invalid change type"):
+        tracker.add_changes([
+            {"project": "proj", "version": "1.0.0", "change_type": TYPE_FEAT, "summary": "Ok"},
+            {"project": "proj", "version": "1.0.0", "change_type": "bogus", "summary": "Bad"},
+        ])
+    assert tracker.list_projects() == []
+
+
+def test_context_manager_closes_connection(tmp_path):
+    with ChangelogTracker(db_path=tmp_path / "ctx.db") as t:
+        t.add_change("proj", "1.0.0", TYPE_FEAT, "Feature")
+        assert t._conn is t._conn
+    assert "_conn" not in t.__dict__
+
+
+def test_generate_md_respects_max_versions(tracker):
+    for v in ("1.0.0", "1.1.0", "1.2.0"):
+        tracker.add_change("proj", v, TYPE_FIX, f"Fix in {v}")
+        tracker.add_change("proj", v, TYPE_FEAT, f"Feature in {v}")
+        tracker.finalize_release("proj", v)
+    md = tracker.generate_md("proj", max_versions=2)
+    assert md.count("\n## [") == 2
+    assert "Fix in 1.2.0" in md and "Feature in 1.1.0" in md
+    assert "1.0.0" not in md
+    data = json.loads(tracker.generate_json("proj"))
+    assert [r["version"] for r in data["releases"]] == ["1.2.0", "1.1.0", "1.0.0"]
+    assert all(len(r["changes"]) == 2 for r in data["releases"])
+
+
+def test_search_changes_matches_details_and_prefix(tracker):
+    tracker.add_change("proj", "1.0.0", TYPE_FIX, "Patch login", details="Race condition in auth")
+    tracker.add_change("proj", "1.0.0", TYPE_FEAT, "Dark mode toggle")
+    assert [r["summary"] for r in tracker.search_changes("auth")] == ["Patch login"]
+    assert [r["summary"] for r in tracker.search_changes("dark mo")] == ["Dark mode toggle"]
+    assert tracker.search_changes('"unbalanced') == []
+
+
+def test_write_json_matches_generate_json(tracker_with_data, tmp_path):
+    tracker_with_data.finalize_release("myapp", "1.0.0")
+    out = tmp_path / "changelog.json"
+    tracker_with_data.write_json("myapp", out)
+    assert json.loads(out.read_text()) == json.loads(tracker_with_data.generate_json("myapp"))
+
+
+def test_search_changes_substring_fallback_is_literal(tracker):
+    tracker.add_change("proj", "1.0.0", TYPE_FIX, "Fix login redirect")
+    tracker.add_change("proj", "1.0.0", TYPE_FIX, "Cap at 100% CPU")
+    assert [r["summary"] for r in tracker.search_changes("ogin")] == ["Fix login redirect"]
+    assert [r["summary"] for r in tracker.search_changes("0% C")] == ["Cap at 100% CPU"]
+    assert tracker.search_changes("x_y") == []
+
+
+def test_search_changes_query_too_short(tracker):
+    with pytest.raises(ValueError, match="too short"):
+        tracker.search_changes("ab")
+
+
+def test_list_versions_semver_order(tracker):
+    for v in ("1.2.0", "2.0.0", "1.10.0", "2.0.0-rc1"):
+        tracker.add_change("proj", v, TYPE_FIX, f"Fix {v}")
+    versions = [v["version"] for v in tracker.list_versions("proj")]
+    assert versions == ["2.0.0", "2.0.0-rc1", "1.10.0", "1.2.0"]
+
+
+def test_generate_md_semver_order(tracker):
+    for v in ("1.10.0", "1.2.0"):
+        tracker.add_change("proj", v, TYPE_FIX, f"Fix {v}")
+        tracker.finalize_release("proj", v)
+    md = tracker.generate_md("proj", max_versions=1)
+    assert "1.10.0" in md and "1.2.0" not in md
+
+
+def test_cmd_import_batches(tracker, tmp_path, capsys):
+    src = tmp_path / "changes.jsonl"
+    src.write_text("\n".join(
+        json.dumps({"project": "other", "version": "1.0.0", "type": TYPE_FIX,
+                    "summary": f"Fix {i}", "pr_number": i})
+        for i in range(5)
+    ) + "\n")
+    args = build_parser().parse_args(["import", str(src), "--batch-size", "2", "--project", "proj"])
+    args.func(args, tracker)
+    assert "Imported 5 change(s)" in capsys.readouterr().out
+    assert tracker.list_projects() == ["proj"]
+    assert len(tracker.finalize_release("proj", "1.0.0").changes) == 5
+
+
+def test_migrates_legacy_is_finalized_schema(tmp_path):
+    import sqlite3
+    db = tmp_path / "legacy.db"
+    conn = sqlite3.connect(db)
+    conn.executescript("""
+        CREATE TABLE change_entries (
+            id TEXT PRIMARY KEY, project TEXT NOT NULL, version TEXT NOT NULL,
+            type TEXT NOT NULL, summary TEXT NOT NULL, details TEXT DEFAULT '',
+            pr_number INTEGER, author TEXT DEFAULT '', date TEXT NOT NULL,
+            is_finalized INTEGER DEFAULT 0
+        );
+        CREATE TABLE releases (
+            id TEXT PRIMARY KEY, project TEXT NOT NULL, version TEXT NOT NULL,
+            release_date TEXT NOT NULL, highlights TEXT DEFAULT '[]',
+            UNIQUE(project, version)
+        );
+        INSERT INTO change_entries VALUES ('a', 'proj', '1.0.0', 'feat', 'Old feature', '', NULL, '', '2024-01-01', 1);
+        INSERT INTO change_entries VALUES ('b', 'proj', '1.1.0', 'fix', 'Pending fix', '', NULL, '', '2024-02-01', 0);
+        INSERT INTO releases VALUES ('r', 'proj', '1.0.0', '2024-01-02', '["Old feature"]');
+    """)
+    conn.close()
+
+    with ChangelogTracker(db_path=db) as t:
+        assert t.list_versions("proj") == [
+            {"version": "1.1.0", "finalized": False},
+            {"version": "1.0.0", "finalized": True},
+        ]
+        assert t.semantic_bump("proj", "1.0.0") == "1.0.1"
+        assert [r["summary"] for r in t.search_changes("old feat")] == ["Old feature"]
+
+
+def test_finalize_highlights_limited_to_feat_and_breaking(tracker):
+    tracker.add_changes(
+        [{"project": "proj", "version": "1.0.0", "change_type": TYPE_FEAT,
+          "summary": f"Feature {i}", "date": f"2024-01-0{i + 1}"} for i in range(7)]
+        + [{"project": "proj", "version": "1.0.0", "change_type": TYPE_FIX, "summary": "A fix"}]
+    )
+    release = tracker.finalize_release("proj", "1.0.0")
+    assert release.highlights == [f"Feature {i}" for i in range(5)]
+    assert len(release.changes) == 8
+
+
+def test_finalize_changes_keep_insertion_order(tracker):
+    for change_type, summary in [(TYPE_FEAT, "F1"), (TYPE_FIX, "X1"), (TYPE_BREAKING, "B1"), (TYPE_FEAT, "F2")]:
+        tracker.add_change("proj", "1.0.0", change_type, summary)
+    release = tracker.finalize_release("proj", "1.0.0")
+    assert [c["summary"] for c in release.changes] == ["F1", "X1", "B1", "F2"]
+
+
+def test_batch_with_shared_date_keeps_insertion_order(tracker):
+    summaries = [(TYPE_FEAT, "F1"), (TYPE_BREAKING, "B1"), (TYPE_FEAT, "F2"), (TYPE_BREAKING, "B2"),
+                 (TYPE_FEAT, "F3"), (TYPE_FEAT, "F4"), (TYPE_FEAT, "F5")]
+    tracker.add_changes([
+        {"project": "proj", "version": "1.0.0", "change_type": t, "summary": f"{s} item"}
+        for t, s in summaries
+    ])
+    release = tracker.finalize_release("proj", "1.0.0")
+    assert release.highlights == ["F1 item", "B1 item", "F2 item", "B2 item", "F3 item"]
+    md = tracker.generate_md("proj")
+    assert md.index("F1 item") < md.index("F2 item") < md.index("F5 item")
+    assert [r["summary"] for r in tracker.search_changes("item")][:2] == ["F5 item", "F4 item"]
+
+
+def test_list_versions_v_prefix_and_date_tiebreak(tracker):
+    for v in ("v1.2.0", "v1.10.0", "v1.3.0", "dev", "nightly"):
+        tracker.add_change("proj", v, TYPE_FIX, f"Fix {v}")
+    versions = [v["version"] for v in tracker.list_versions("proj")]
+    assert versions == ["v1.10.0", "v1.3.0", "v1.2.0", "nightly", "dev"]
+
+
+def test_cmd_import_bad_line_writes_nothing(tracker, tmp_path):
+    src = tmp_path / "changes.jsonl"
+    src.write_text(
+        json.dumps({"project": "proj", "version": "1.0.0", "type": TYPE_FIX, "summary": "Ok 1"}) + "\n"
+        + json.dumps({"project": "proj", "version": "1.0.0", "type": TYPE_FIX, "summary": "Ok 2"}) + "\n"
+        + json.dumps({"project": "proj", "version": "1.0.0", "type": TYPE_FIX}) + "\n"
+    )
+    args = build_parser().parse_args(["import", str(src), "--batch-size", "1"])
+    with pytest.raises(ValueError, match=r"changes\.jsonl:3: missing field 'summary'"):
+        args.func(args, tracker)
+    assert tracker.list_projects() == []
+
+
+def test_import_rejects_non_positive_batch_size():
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["import", "x.jsonl", "--batch-size", "0"])
+
+
+def test_json_output_same_with_and_without_orjson(tracker, monkeypatch):
+    import changelog_tracker
+    tracker.add_change("proj", "1.0.0", TYPE_FEAT, "Café ✨ support")
+    tracker.finalize_release("proj", "1.0.0")
+    monkeypatch.setattr(changelog_tracker, "orjson", None)
+    stdlib = tracker.generate_json("proj")
+    assert "Café ✨ support" in stdlib
+    monkeypatch.undo()
+    if changelog_tracker.orjson is not None:
+        assert tracker.generate_json("proj") == stdlib
+
+
+@pytest.mark.parametrize("record, message", [
+    ({"project": "p", "version": 1.0, "type": TYPE_FIX, "summary": "s"}, "'version' must be a string"),
+    ([1, 2], "expected a JSON object, got list"),
+    ({"project": "p", "version": "1.0.0", "type": TYPE_FIX, "summary": 5}, "'summary' must be a string"),
+    ({"project": "p", "version": "1.0.0", "type": TYPE_FIX, "summary": "s", "pr_number": "7"},
+     "'pr_number' must be an integer"),
+])
+def test_cmd_import_rejects_bad_field_types(tracker, tmp_path, record, message):
+    src = tmp_path / "changes.jsonl"
+    good = {"project": "p", "version": "1.0.0", "type": TYPE_FIX, "summary": "Fine"}
+    src.write_text(json.dumps(good) + "\n" + json.dumps(record) + "\n", encoding="utf-8")
+    args = build_parser().parse_args(["import", str(src), "--batch-size", "1"])
+    with pytest.raises(ValueError, match=r"changes\.jsonl:2: .*" + message):
+        args.func(args, tracker)
+    assert tracker.list_projects() == []
+
+
+def test_cmd_import_reads_input_once(tracker, tmp_path, monkeypatch, capsys):
+    import builtins
+    src = tmp_path / "changes.jsonl"
+    src.write_text(json.dumps({"project": "proj", "version": "1.0.0", "type": TYPE_FIX, "summary": "Piped"}) + "\n")
+    opened = []
+    real_open = builtins.open
+
+    def counting_open(path, *a, **kw):
+        if str(path) == str(src):
+            opened.append(path)
+        return real_open(path, *a, **kw)
+
+    monkeypatch.setattr(builtins, "open", counting_open)
+    args = build_parser().parse_args(["import", str(src)])
+    args.func(args, tracker)
+    assert len(opened) == 1
+    assert "Imported 1 change(s)" in capsys.readouterr().out
+
+
+def test_finalize_waits_for_concurrent_writer(tmp_path):
+    import threading
+    import time
+    db = tmp_path / "shared.db"
+    with ChangelogTracker(db_path=db) as a, ChangelogTracker(db_path=db) as b:
+        a.add_change("proj", "1.0.0", TYPE_FEAT, "Feature")
+        b._conn.execute("BEGIN IMMEDIATE")
+        b._conn.execute(
+            "INSERT INTO releases (id, project, version, release_date) VALUES ('x', 'other', '1.0.0', 'now')"
+        )
+
+        def commit_later():
+            time.sleep(0.3)
+            b._conn.execute("COMMIT")
+
+        t = threading.Thread(target=commit_later)
+        t.start()
+        release = a.finalize_release("proj", "1.0.0")
+        t.join()
+        assert release.highlights == ["Feature"]
+
+
+def test_generate_json_changes_in_insertion_order(tracker):
+    for change_type, summary in [(TYPE_FIX, "X1"), (TYPE_FEAT, "F1"), (TYPE_CHORE, "C1"),
+                                 (TYPE_BREAKING, "B1"), (TYPE_FIX, "X2")]:
+        tracker.add_change("proj", "1.0.0", change_type, summary)
+    tracker.finalize_release("proj", "1.0.0")
+    data = json.loads(tracker.generate_json("proj"))
+    assert [c["summary"] for c in data["releases"][0]["changes"]] == ["X1", "F1", "C1", "B1", "X2"]
+    md = tracker.generate_md("proj")
+    assert md.index("Features") < md.index("Bug Fixes") < md.index("Breaking Changes")
+    assert md.index("X1") < md.index("X2")